@@ -1,21 +1,251 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
-from fastapi.responses import JSONResponse
-from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, text
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import column, event, or_, select, table, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from pydantic import BaseModel, TypeAdapter
 import pandas as pd
 from io import BytesIO
+from contextlib import asynccontextmanager
+import asyncio
+import orjson
 import os
+import re
 import sqlite3
 
 # Create SQLAlchemy engine
-DATABASE_URL = f"sqlite:///sites_xlsx_export.db"
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The dataset is a few MB, so it is copied from DATABASE_PATH into a shared-cache in-memory
+# database at startup and after every upload. Every request reads that copy through one
+# shared read-only connection.
+DATABASE_PATH = "sites_xlsx_export.db"
+MEMORY_DATABASE_URI = "file:sites_xlsx_export?mode=memory&cache=shared"
+DATABASE_URL = f"sqlite+aiosqlite:///{MEMORY_DATABASE_URI}&uri=true"
+
+# Keeps the in-memory database alive, it is dropped once its last connection closes
+memory_db = sqlite3.connect(MEMORY_DATABASE_URI, uri=True, check_same_thread=False)
+
+engine = create_async_engine(
+    DATABASE_URL,
+    # aiosqlite runs the connection on its own worker thread
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Refuse writes on the shared connection and keep temporary tables in memory
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=1")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
+# Schema of the sites table, uploads are written into a table created from it so the column
+# types stay the same whatever pandas inferred from the workbook
+SITES_TABLE_SQL = """
+    CREATE TABLE {table} (
+        unique_number INTEGER, id_no INTEGER, rev_bis TEXT, name_en TEXT, name_fr TEXT,
+        short_description_en TEXT, short_description_fr TEXT, justification_en TEXT,
+        justification_fr TEXT, date_inscribed INTEGER, secondary_dates TEXT, danger INTEGER,
+        date_end REAL, danger_list TEXT, longitude REAL, latitude REAL, area_hectares REAL,
+        c1 INTEGER, c2 INTEGER, c3 INTEGER, c4 INTEGER, c5 INTEGER, c6 INTEGER,
+        n7 INTEGER, n8 INTEGER, n9 INTEGER, n10 INTEGER, criteria_txt TEXT,
+        category TEXT, category_short TEXT, states_name_en TEXT, states_name_fr TEXT,
+        region_en TEXT, region_fr TEXT, iso_code TEXT, udnp_code TEXT, transboundary INTEGER
+    )
+"""
+
+# Full-text index over the searchable columns, backed by sites_xlsx_export
+SEARCH_INDEX_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS sites_fts USING fts5(
+        name_en, name_fr, short_description_en, short_description_fr,
+        justification_en, justification_fr, states_name_en, region_en,
+        content='sites_xlsx_export', content_rowid='id_no'
+    );
+    INSERT INTO sites_fts(sites_fts) VALUES('rebuild');
+"""
+
+# Indexes backing the paginated listing, filter, reference data and stats endpoints
+INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_sites_uniq ON sites_xlsx_export(unique_number);
+    CREATE INDEX IF NOT EXISTS idx_sites_country ON sites_xlsx_export(states_name_en);
+    CREATE INDEX IF NOT EXISTS idx_sites_region ON sites_xlsx_export(region_en);
+    CREATE INDEX IF NOT EXISTS idx_sites_category ON sites_xlsx_export(category_short);
+    CREATE INDEX IF NOT EXISTS idx_sites_date_inscribed ON sites_xlsx_export(date_inscribed);
+    CREATE INDEX IF NOT EXISTS idx_sites_danger ON sites_xlsx_export(danger);
+    CREATE INDEX IF NOT EXISTS idx_sites_transboundary ON sites_xlsx_export(transboundary);
+    CREATE INDEX IF NOT EXISTS idx_geo ON sites_xlsx_export(states_name_en, region_en, category_short)
+        WHERE longitude IS NOT NULL AND latitude IS NOT NULL;
+    ANALYZE;
+    PRAGMA optimize;
+"""
+
+# Bit of each criterion in the criteria_mask column
+CRITERIA_BITS = {
+    name: 1 << bit
+    for bit, name in enumerate([f"c{i}" for i in range(1, 7)] + [f"n{i}" for i in range(7, 11)])
+}
+
+# Generated column packing the ten criteria flags into one integer, so a set of
+# criteria is tested with a single (criteria_mask & :mask) = :mask predicate
+CRITERIA_MASK_SQL = "ALTER TABLE sites_xlsx_export ADD COLUMN criteria_mask INTEGER GENERATED ALWAYS AS ({}) VIRTUAL".format(
+    " | ".join(f"(({name} IS 1) << {mask.bit_length() - 1})" for name, mask in CRITERIA_BITS.items())
+)
+
+def criteria_to_mask(criteria: str) -> int:
+    """
+    Combine comma-separated criteria (e.g. 'c1,n7') into a criteria_mask value, unknown criteria are ignored
+    """
+    mask = 0
+    for criterion in criteria.split(','):
+        mask |= CRITERIA_BITS.get(criterion.strip().lower(), 0)
+    return mask
+
+# Queries made only of word characters can be handed to FTS5 safely
+FTS_QUERY_PATTERN = re.compile(r"^[\w\s]+$")
+
+def setup_database(conn: sqlite3.Connection):
+    """
+    Add the criteria_mask column, create the indexes and build the search index on a copy of the sites table.
+    These structures are derived from the data, so they are only built in memory and never written to DATABASE_PATH.
+    """
+    # Generated columns are only listed by table_xinfo
+    columns = [row[1] for row in conn.execute("PRAGMA table_xinfo(sites_xlsx_export)")]
+    if "criteria_mask" not in columns:
+        conn.execute(CRITERIA_MASK_SQL)
+    conn.executescript(INDEX_SQL)
+    conn.executescript(SEARCH_INDEX_SQL)
+    conn.commit()
+
+def load_into_memory():
+    """
+    Copy the on-disk database into the shared in-memory database and build the derived structures there
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        conn.backup(memory_db)
+    finally:
+        conn.close()
+    setup_database(memory_db)
+
+class ReadGate:
+    """
+    Lets any number of requests read the shared in-memory database at once. A refresh holds new
+    readers off and waits for the running ones, so the backup into it never meets a table lock.
+    """
+    def __init__(self):
+        self.readers = 0
+        self.refreshing = False
+        self.condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def read(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.refreshing)
+            self.readers += 1
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.readers -= 1
+                self.condition.notify_all()
+
+    @asynccontextmanager
+    async def refresh(self):
+        async with self.condition:
+            self.refreshing = True
+            await self.condition.wait_for(lambda: self.readers == 0)
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.refreshing = False
+                self.condition.notify_all()
+
+read_gate = ReadGate()
+
+# Serializes uploads, and with them every write to memory_db after startup
+upload_lock = asyncio.Lock()
+
+def build_import(contents: bytes) -> Tuple[sqlite3.Connection, int]:
+    """
+    Parse an uploaded Excel export once and prepare it without touching the live data:
+    a private in-memory database with the sites table and its derived structures,
+    and the rows staged in sites_xlsx_export_staging on disk.
+    Returns the private database and the number of imported rows.
+    """
+    df = pd.read_excel(BytesIO(contents), engine='calamine', dtype_backend='pyarrow')
+    missing = [name for name in SiteDetail.model_fields if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    # Extra columns are dropped, a criteria_mask column would otherwise take the place of the generated one
+    df = df[list(SiteDetail.model_fields)]
+    
+    staging_db = sqlite3.connect(":memory:", check_same_thread=False)
+    try:
+        staging_db.execute(SITES_TABLE_SQL.format(table='sites_xlsx_export'))
+        df.to_sql('sites_xlsx_export', staging_db, if_exists='append', index=False, chunksize=5000)
+        setup_database(staging_db)
+        
+        conn = sqlite3.connect(DATABASE_PATH)
+        try:
+            conn.execute("DROP TABLE IF EXISTS sites_xlsx_export_staging")
+            conn.execute(SITES_TABLE_SQL.format(table='sites_xlsx_export_staging'))
+            df.to_sql('sites_xlsx_export_staging', conn, if_exists='append', index=False, chunksize=5000)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception:
+        staging_db.close()
+        raise
+    return staging_db, len(df)
+
+def commit_import():
+    """
+    Swap the staged rows in for sites_xlsx_export in one transaction
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        conn.execute("BEGIN")
+        conn.execute("DROP TABLE sites_xlsx_export")
+        conn.execute("ALTER TABLE sites_xlsx_export_staging RENAME TO sites_xlsx_export")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def discard_import():
+    """
+    Drop the rows staged by a failed upload
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        conn.execute("DROP TABLE IF EXISTS sites_xlsx_export_staging")
+        conn.commit()
+    finally:
+        conn.close()
+
+def build_match_query(q: str) -> Optional[str]:
+    """
+    Translate a user search string into an FTS5 MATCH expression.
+    Every token is quoted and prefix matched, e.g. 'great wall' -> '"great"* "wall"*'.
+    Returns None when the string contains characters FTS5 would not tokenize.
+    """
+    if not FTS_QUERY_PATTERN.match(q) or not q.strip():
+        return None
+    return " ".join(f'"{token}"*' for token in q.split())
+
+load_into_memory()
+
 # Pydantic models for response
 class Site(BaseModel):
     unique_number: Optional[int] = None
@@ -58,13 +288,60 @@ class SiteDetail(Site):
     udnp_code: Optional[str] = None
     transboundary: Optional[int] = None
 
-# Helper to get database session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# UNESCO World Heritage selection criteria, served as-is by /criteria
+CRITERIA_INFO = {
+    "cultural": [
+        {"id": "c1", "description": "Represents a masterpiece of human creative genius"},
+        {"id": "c2", "description": "Exhibits an important interchange of human values"},
+        {"id": "c3", "description": "Bears a unique or exceptional testimony to a cultural tradition"},
+        {"id": "c4", "description": "Outstanding example of a type of building, architecture or landscape"},
+        {"id": "c5", "description": "Outstanding example of a traditional human settlement or land-use"},
+        {"id": "c6", "description": "Associated with events or living traditions, ideas, or beliefs"}
+    ],
+    "natural": [
+        {"id": "n7", "description": "Contains superlative natural phenomena or exceptional natural beauty"},
+        {"id": "n8", "description": "Outstanding example representing major stages of Earth's history"},
+        {"id": "n9", "description": "Outstanding example representing significant ecological and biological processes"},
+        {"id": "n10", "description": "Contains the most important natural habitats for conservation of biological diversity"}
+    ]
+}
+
+# Projection returned by the site list endpoints, built once as a Core select so
+# every endpoint variant hits SQLAlchemy's compiled-statement cache
+SITE_COLUMN_NAMES = [
+    "unique_number", "id_no", "rev_bis", "name_en", "name_fr", "short_description_en",
+    "short_description_fr", "longitude", "latitude", "category", "category_short",
+    "states_name_en", "region_en", "date_inscribed",
+]
+FILTER_COLUMN_NAMES = ["justification_en", "justification_fr", "danger", "transboundary", "criteria_mask"]
+sites_table = table("sites_xlsx_export", *[column(name) for name in SITE_COLUMN_NAMES + FILTER_COLUMN_NAMES])
+SITE_COLUMNS = [sites_table.c[name] for name in SITE_COLUMN_NAMES]
+BASE_SELECT = select(*SITE_COLUMNS).select_from(sites_table)
+
+# Dataset columns returned by /detail, the in-memory criteria_mask column is left out
+SITE_DETAIL_QUERY = text(f"""
+    SELECT {", ".join(SiteDetail.model_fields)} FROM sites_xlsx_export WHERE id_no = :site_id
+""")
+
+# Columns searched by the LIKE fallback of /search
+SEARCH_COLUMNS = [
+    "name_en", "name_fr", "short_description_en", "short_description_fr",
+    "justification_en", "justification_fr", "states_name_en", "region_en",
+]
+
+# Site ids matching an FTS5 expression
+FTS_MATCH_IDS = text("SELECT rowid FROM sites_fts WHERE sites_fts MATCH :search").columns(column("rowid"))
+
+# Distinct countries, regions and categories only change on upload, so they are
+# cached in-process after the first request and cleared by upload_xls
+reference_cache: Dict[str, List[str]] = {}
+
+# Helper to get database session, endpoints depend on it with scope="function" so the
+# read slot is released before the response is sent and a slow client cannot hold off a refresh
+async def get_db():
+    async with read_gate.read():
+        async with SessionLocal() as db:
+            yield db
 
 router = APIRouter(
     prefix="/sites",
@@ -73,15 +350,40 @@ router = APIRouter(
 
 # Add additional models for advanced features
 class Pagination(BaseModel):
-    total: int
-    page: int
-    total_pages: int
     per_page: int
+    next_cursor: Optional[int] = None
     
 class PaginatedResponse(BaseModel):
-    data: List[Dict[str, Any]] 
+    data: List[Site] 
     pagination: Pagination
 
+# Validates and dumps a whole page of rows in one pydantic-core call,
+# endpoints using it set response_model=None and document the model through responses
+SITE_LIST_ADAPTER = TypeAdapter(List[Site])
+
+def serialize_sites(sites) -> List[Dict[str, Any]]:
+    """
+    Validate result rows as Site objects and dump them to JSON-ready dicts
+    """
+    return SITE_LIST_ADAPTER.dump_python(SITE_LIST_ADAPTER.validate_python(sites), mode='json')
+
+def json_response(content: Any) -> Response:
+    """
+    Encode data already dumped by serialize_sites with orjson, skipping FastAPI's own encoding pass
+    """
+    return Response(orjson.dumps(content), media_type="application/json")
+
+def paginate(sites: List[Dict[str, Any]], per_page: int) -> Dict[str, Any]:
+    """
+    Wrap a page of sites in the pagination envelope.
+    next_cursor is the last unique_number on a full page, pass it as after_id to get the next one.
+    """
+    next_cursor = sites[-1]["unique_number"] if sites and len(sites) == per_page else None
+    return {
+        "data": serialize_sites(sites),
+        "pagination": {"per_page": per_page, "next_cursor": next_cursor},
+    }
+
 @router.get("/")
 def heritage_sites_root():
     """
@@ -110,39 +412,28 @@ def heritage_sites_root():
         "documentation": "/docs"
     }
 
-@router.get("/all", response_model=List[Site])
-def get_all_sites(
-    page: int = Query(1, description="Page number (starts from 1)"),
+@router.get("/all", response_model=None, responses={200: {"model": PaginatedResponse}})
+async def get_all_sites(
+    after_id: Optional[int] = Query(None, description="Cursor from the previous page (pagination.next_cursor)"),
     per_page: int = Query(100, description="Items per page"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
-    Get all heritage sites with pagination
+    Get all heritage sites with cursor pagination
     """
-    # Calculate pagination values
-    skip = (page - 1) * per_page
+    # Seek past the cursor on the unique_number index instead of skipping rows
+    query = BASE_SELECT
+    if after_id is not None:
+        query = query.where(sites_table.c.unique_number > after_id)
+    query = query.order_by(sites_table.c.unique_number).limit(per_page)
     
-    query = text("""
-        SELECT unique_number, id_no, rev_bis, name_en, name_fr, short_description_en, 
-               short_description_fr, longitude, latitude, category, category_short, 
-               states_name_en, region_en, date_inscribed 
-        FROM sites_xlsx_export
-        LIMIT :limit OFFSET :skip
-    """)
+    result = await db.execute(query)
+    sites = result.mappings().all()
     
-    result = db.execute(query, {"skip": skip, "limit": per_page})
-    sites = []
-    for row in result:
-        # Convert row to dictionary properly
-        site = {}
-        for column, value in row._mapping.items():
-            site[column] = value
-        sites.append(site)
-    
-    return sites
+    return json_response(paginate(sites, per_page))
 
-@router.get("/filter", response_model=List[Site])
-def filter_sites(
+@router.get("/filter", response_model=None, responses={200: {"model": PaginatedResponse}})
+async def filter_sites(
     country: Optional[str] = Query(None, description="Filter by country name"),
     region: Optional[str] = Query(None, description="Filter by region"),
     category: Optional[str] = Query(None, description="Filter by category (cultural, natural, mixed)"),
@@ -152,210 +443,173 @@ def filter_sites(
     search: Optional[str] = Query(None, description="Search in name and description"),
     criteria: Optional[str] = Query(None, description="Filter by criteria (comma-separated, e.g. 'c1,n7')"),
     transboundary: Optional[bool] = Query(None, description="Filter by transboundary status"),
-    page: int = Query(1, description="Page number (starts from 1)"),
+    after_id: Optional[int] = Query(None, description="Cursor from the previous page (pagination.next_cursor)"),
     per_page: int = Query(100, description="Items per page"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
     Filter heritage sites by various parameters
     """
     # Start building the query
-    query_parts = [
-        """
-        SELECT unique_number, id_no, rev_bis, name_en, name_fr, short_description_en, 
-               short_description_fr, longitude, latitude, category, category_short, 
-               states_name_en, region_en, date_inscribed 
-        FROM sites_xlsx_export 
-        WHERE 1=1
-        """
-    ]
-    params = {}
+    query = BASE_SELECT
+    columns = sites_table.c
     
     # Add filters
     if country:
-        query_parts.append("AND states_name_en LIKE :country")
-        params["country"] = f"%{country}%"
+        query = query.where(columns.states_name_en.like(f"%{country}%"))
     
     if region:
-        query_parts.append("AND region_en LIKE :region")
-        params["region"] = f"%{region}%"
+        query = query.where(columns.region_en.like(f"%{region}%"))
     
     if category:
-        query_parts.append("AND category_short LIKE :category")
-        params["category"] = f"%{category}%"
+        query = query.where(columns.category_short.like(f"%{category}%"))
     
     if danger is not None:
-        query_parts.append("AND danger = :danger")
-        params["danger"] = 1 if danger else 0
+        query = query.where(columns.danger == (1 if danger else 0))
     
     if transboundary is not None:
-        query_parts.append("AND transboundary = :transboundary")
-        params["transboundary"] = 1 if transboundary else 0
+        query = query.where(columns.transboundary == (1 if transboundary else 0))
     
     if year_from:
-        query_parts.append("AND date_inscribed >= :year_from")
-        params["year_from"] = year_from
+        query = query.where(columns.date_inscribed >= year_from)
     
     if year_to:
-        query_parts.append("AND date_inscribed <= :year_to")
-        params["year_to"] = year_to
+        query = query.where(columns.date_inscribed <= year_to)
     
     if search:
-        query_parts.append("AND (name_en LIKE :search OR name_fr LIKE :search OR short_description_en LIKE :search OR short_description_fr LIKE :search)")
-        params["search"] = f"%{search}%"
+        pattern = f"%{search}%"
+        query = query.where(or_(
+            columns.name_en.like(pattern),
+            columns.name_fr.like(pattern),
+            columns.short_description_en.like(pattern),
+            columns.short_description_fr.like(pattern),
+        ))
     
     if criteria:
-        criteria_list = criteria.split(',')
-        for i, criterion in enumerate(criteria_list):
-            criterion = criterion.strip().lower()
-            if criterion.startswith('c') and criterion[1:].isdigit():
-                col_num = int(criterion[1:])
-                if 1 <= col_num <= 6:
-                    query_parts.append(f"AND c{col_num} = 1")
-            elif criterion.startswith('n') and criterion[1:].isdigit():
-                col_num = int(criterion[1:])
-                if 7 <= col_num <= 10:
-                    query_parts.append(f"AND n{col_num} = 1")
-    
-    # Calculate pagination values
-    skip = (page - 1) * per_page
-    
-    # Add pagination
-    query_parts.append("LIMIT :limit OFFSET :skip")
-    params["skip"] = skip
-    params["limit"] = per_page
+        mask = criteria_to_mask(criteria)
+        if mask:
+            query = query.where(columns.criteria_mask.op("&")(mask) == mask)
+    
+    # Add pagination, seeking past the cursor on the unique_number index
+    if after_id is not None:
+        query = query.where(columns.unique_number > after_id)
+    query = query.order_by(columns.unique_number).limit(per_page)
     
     # Execute query
-    full_query = " ".join(query_parts)
-    result = db.execute(text(full_query), params)
-    sites = [dict(row) for row in result]
+    result = await db.execute(query)
+    sites = result.mappings().all()
     
-    return sites
+    return json_response(paginate(sites, per_page))
 
 @router.get("/detail/{site_id}", response_model=SiteDetail)
-def get_site_detail(
+async def get_site_detail(
     site_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
     Get detailed information about a specific heritage site
     """
-    query = text("""
-        SELECT * FROM sites_xlsx_export WHERE id_no = :site_id
-    """)
-    
-    result = db.execute(query, {"site_id": site_id}).fetchone()
+    site_data = (await db.execute(SITE_DETAIL_QUERY, {"site_id": site_id})).mappings().first()
     
-    if not result:
+    if not site_data:
         raise HTTPException(status_code=404, detail=f"Site with ID {site_id} not found")
     
-    # Convert row to dict
-    site_data = dict(result)
     return site_data
 
 @router.get("/countries", response_model=List[str])
-def get_countries(db: Session = Depends(get_db)):
+async def get_countries(db: AsyncSession = Depends(get_db, scope="function")):
     """
     Get a list of all countries with heritage sites
     """
-    query = text("""
-        SELECT DISTINCT states_name_en FROM sites_xlsx_export 
-        WHERE states_name_en IS NOT NULL
-        ORDER BY states_name_en
-    """)
-    
-    result = db.execute(query)
-    countries = [row[0] for row in result if row[0]]
-    
-    return countries
+    if "countries" not in reference_cache:
+        query = text("""
+            SELECT DISTINCT states_name_en FROM sites_xlsx_export 
+            WHERE states_name_en IS NOT NULL
+            ORDER BY states_name_en
+        """)
+        
+        result = await db.execute(query)
+        reference_cache["countries"] = [row[0] for row in result if row[0]]
+    
+    return reference_cache["countries"]
 
 @router.get("/regions", response_model=List[str])
-def get_regions(db: Session = Depends(get_db)):
+async def get_regions(db: AsyncSession = Depends(get_db, scope="function")):
     """
     Get a list of all regions with heritage sites
     """
-    query = text("""
-        SELECT DISTINCT region_en FROM sites_xlsx_export 
-        WHERE region_en IS NOT NULL
-        ORDER BY region_en
-    """)
-    
-    result = db.execute(query)
-    regions = [row[0] for row in result if row[0]]
-    
-    return regions
+    if "regions" not in reference_cache:
+        query = text("""
+            SELECT DISTINCT region_en FROM sites_xlsx_export 
+            WHERE region_en IS NOT NULL
+            ORDER BY region_en
+        """)
+        
+        result = await db.execute(query)
+        reference_cache["regions"] = [row[0] for row in result if row[0]]
+    
+    return reference_cache["regions"]
 
 @router.get("/categories", response_model=List[str])
-def get_categories(db: Session = Depends(get_db)):
+async def get_categories(db: AsyncSession = Depends(get_db, scope="function")):
     """
     Get a list of all site categories
     """
-    query = text("""
-        SELECT DISTINCT category_short FROM sites_xlsx_export 
-        WHERE category_short IS NOT NULL
-        ORDER BY category_short
-    """)
-    
-    result = db.execute(query)
-    categories = [row[0] for row in result if row[0]]
-    
-    return categories
+    if "categories" not in reference_cache:
+        query = text("""
+            SELECT DISTINCT category_short FROM sites_xlsx_export 
+            WHERE category_short IS NOT NULL
+            ORDER BY category_short
+        """)
+        
+        result = await db.execute(query)
+        reference_cache["categories"] = [row[0] for row in result if row[0]]
+    
+    return reference_cache["categories"]
 
-@router.get("/sites-by-country/{country}", response_model=List[Site])
-def get_sites_by_country(
+@router.get("/sites-by-country/{country}", response_model=None, responses={200: {"model": List[Site]}})
+async def get_sites_by_country(
     country: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
     Get all heritage sites for a specific country
     """
-    query = text("""
-        SELECT unique_number, id_no, rev_bis, name_en, name_fr, short_description_en, 
-               short_description_fr, longitude, latitude, category, category_short, 
-               states_name_en, region_en, date_inscribed 
-        FROM sites_xlsx_export 
-        WHERE states_name_en = :country
-        ORDER BY name_en
-    """)
+    query = (
+        BASE_SELECT
+        .where(sites_table.c.states_name_en == country)
+        .order_by(sites_table.c.name_en)
+    )
     
-    result = db.execute(query, {"country": country})
-    sites = [dict(row) for row in result]
+    result = await db.execute(query)
+    sites = result.mappings().all()
     
-    return sites
+    return json_response(serialize_sites(sites))
 
 @router.get("/criteria")
 def get_criteria_info():
     """
     Get information about the UNESCO World Heritage criteria
     """
-    criteria_info = {
-        "cultural": [
-            {"id": "c1", "description": "Represents a masterpiece of human creative genius"},
-            {"id": "c2", "description": "Exhibits an important interchange of human values"},
-            {"id": "c3", "description": "Bears a unique or exceptional testimony to a cultural tradition"},
-            {"id": "c4", "description": "Outstanding example of a type of building, architecture or landscape"},
-            {"id": "c5", "description": "Outstanding example of a traditional human settlement or land-use"},
-            {"id": "c6", "description": "Associated with events or living traditions, ideas, or beliefs"}
-        ],
-        "natural": [
-            {"id": "n7", "description": "Contains superlative natural phenomena or exceptional natural beauty"},
-            {"id": "n8", "description": "Outstanding example representing major stages of Earth's history"},
-            {"id": "n9", "description": "Outstanding example representing significant ecological and biological processes"},
-            {"id": "n10", "description": "Contains the most important natural habitats for conservation of biological diversity"}
-        ]
-    }
-    return criteria_info
+    return CRITERIA_INFO
 
 @router.get("/stats")
-def get_site_statistics(db: Session = Depends(get_db)):
+async def get_site_statistics(db: AsyncSession = Depends(get_db, scope="function")):
     """
     Get general statistics about the heritage sites
     """
     stats = {}
     
-    # Total count
-    query = text("SELECT COUNT(*) FROM sites_xlsx_export")
-    stats["total_sites"] = db.execute(query).scalar()
+    # Total, danger, transboundary and per-criterion counts in a single pass
+    query = text("""
+        SELECT COUNT(*),
+               TOTAL(danger = 1), TOTAL(transboundary = 1),
+               TOTAL(c1 = 1), TOTAL(c2 = 1), TOTAL(c3 = 1), TOTAL(c4 = 1), TOTAL(c5 = 1), TOTAL(c6 = 1),
+               TOTAL(n7 = 1), TOTAL(n8 = 1), TOTAL(n9 = 1), TOTAL(n10 = 1)
+        FROM sites_xlsx_export
+    """)
+    totals = [int(value) for value in (await db.execute(query)).fetchone()]
+    stats["total_sites"] = totals[0]
     
     # Count by category
     query = text("""
@@ -364,7 +618,7 @@ def get_site_statistics(db: Session = Depends(get_db)):
         WHERE category_short IS NOT NULL
         GROUP BY category_short
     """)
-    result = db.execute(query)
+    result = await db.execute(query)
     stats["sites_by_category"] = {row[0]: row[1] for row in result if row[0]}
     
     # Count by region
@@ -375,26 +629,15 @@ def get_site_statistics(db: Session = Depends(get_db)):
         GROUP BY region_en
         ORDER BY COUNT(*) DESC
     """)
-    result = db.execute(query)
+    result = await db.execute(query)
     stats["sites_by_region"] = {row[0]: row[1] for row in result if row[0]}
     
-    # Count in danger
-    query = text("SELECT COUNT(*) FROM sites_xlsx_export WHERE danger = 1")
-    stats["sites_in_danger"] = db.execute(query).scalar()
-    
-    # Count transboundary sites
-    query = text("SELECT COUNT(*) FROM sites_xlsx_export WHERE transboundary = 1")
-    stats["transboundary_sites"] = db.execute(query).scalar()
+    stats["sites_in_danger"] = totals[1]
+    stats["transboundary_sites"] = totals[2]
     
     # Count by criteria (cultural and natural)
-    stats["criteria_counts"] = {}
-    for i in range(1, 7):
-        query = text(f"SELECT COUNT(*) FROM sites_xlsx_export WHERE c{i} = 1")
-        stats["criteria_counts"][f"c{i}"] = db.execute(query).scalar()
-    
-    for i in range(7, 11):
-        query = text(f"SELECT COUNT(*) FROM sites_xlsx_export WHERE n{i} = 1")
-        stats["criteria_counts"][f"n{i}"] = db.execute(query).scalar()
+    criteria_columns = [f"c{i}" for i in range(1, 7)] + [f"n{i}" for i in range(7, 11)]
+    stats["criteria_counts"] = dict(zip(criteria_columns, totals[3:]))
     
     # Count by decade
     query = text("""
@@ -406,49 +649,83 @@ def get_site_statistics(db: Session = Depends(get_db)):
         GROUP BY decade
         ORDER BY decade
     """)
-    result = db.execute(query)
+    result = await db.execute(query)
     stats["sites_by_decade"] = {f"{row[0]}s": row[1] for row in result if row[0] is not None}
     
     return stats
 
-@router.get("/search", response_model=List[Site])
-def search_sites(
+@router.get("/search", response_model=None, responses={200: {"model": List[Site]}})
+async def search_sites(
     q: str = Query(..., description="Search query"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
     Search for heritage sites by name or description
     """
-    query = text("""
-        SELECT unique_number, id_no, rev_bis, name_en, name_fr, short_description_en, 
-               short_description_fr, longitude, latitude, category, category_short, 
-               states_name_en, region_en, date_inscribed 
-        FROM sites_xlsx_export 
-        WHERE name_en LIKE :search
-           OR name_fr LIKE :search
-           OR short_description_en LIKE :search
-           OR short_description_fr LIKE :search
-           OR justification_en LIKE :search
-           OR justification_fr LIKE :search
-           OR states_name_en LIKE :search
-           OR region_en LIKE :search
-        LIMIT 100
-    """)
-    
-    result = db.execute(query, {"search": f"%{q}%"})
-    sites = [dict(row) for row in result]
-    
-    return sites
+    match_query = build_match_query(q)
+    if match_query is not None:
+        query = BASE_SELECT.where(sites_table.c.id_no.in_(FTS_MATCH_IDS)).limit(100)
+        result = await db.execute(query, {"search": match_query})
+    else:
+        # Fall back to substring matching for input FTS5 can't tokenize
+        pattern = f"%{q}%"
+        query = BASE_SELECT.where(or_(*[sites_table.c[name].like(pattern) for name in SEARCH_COLUMNS])).limit(100)
+        result = await db.execute(query)
+    sites = result.mappings().all()
+    
+    return json_response(serialize_sites(sites))
+
+def build_feature(site) -> Dict[str, Any]:
+    """
+    Build a GeoJSON feature from a /geo result row
+    """
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [site["longitude"], site["latitude"]]
+        },
+        "properties": {
+            "id": site["id_no"],
+            "name": site["name_en"],
+            "category": site["category_short"],
+            "country": site["states_name_en"],
+            "region": site["region_en"],
+            "danger": bool(site["danger"]),
+            "transboundary": bool(site["transboundary"]),
+            "criteria": {
+                "c1": bool(site["c1"]),
+                "c2": bool(site["c2"]),
+                "c3": bool(site["c3"]),
+                "c4": bool(site["c4"]),
+                "c5": bool(site["c5"]),
+                "c6": bool(site["c6"]),
+                "n7": bool(site["n7"]),
+                "n8": bool(site["n8"]),
+                "n9": bool(site["n9"]),
+                "n10": bool(site["n10"])
+            }
+        }
+    }
+
+async def fetch_geojson(query, params: Dict[str, Any]) -> bytes:
+    """
+    Read the matching rows and encode them as a JSON array of features.
+    Everything is done inside the read slot, which is released before the body is sent.
+    """
+    async with read_gate.read():
+        async with SessionLocal() as db:
+            result = await db.execute(query, params)
+            return orjson.dumps([build_feature(site) for site in result.mappings()])
 
 @router.get("/geo", response_model=List[Dict[str, Any]])
-def get_geojson_data(
+async def get_geojson_data(
     country: Optional[str] = Query(None, description="Filter by country name"),
     region: Optional[str] = Query(None, description="Filter by region"),
     category: Optional[str] = Query(None, description="Filter by category"),
     criteria: Optional[str] = Query(None, description="Filter by criteria (e.g., 'c1')"),
     danger: Optional[bool] = Query(None, description="Filter by danger status"),
     transboundary: Optional[bool] = Query(None, description="Filter by transboundary status"),
-    db: Session = Depends(get_db)
 ):
     """
     Get GeoJSON-compatible data for map visualization
@@ -485,46 +762,42 @@ def get_geojson_data(
         params["transboundary"] = 1 if transboundary else 0
     
     if criteria:
-        criteria_type = criteria[0].lower()
-        criteria_num = criteria[1:]
-        if criteria_type == 'c' and criteria_num.isdigit() and 1 <= int(criteria_num) <= 6:
-            query_parts.append(f"AND c{criteria_num} = 1")
-        elif criteria_type == 'n' and criteria_num.isdigit() and 7 <= int(criteria_num) <= 10:
-            query_parts.append(f"AND n{criteria_num} = 1")
+        mask = CRITERIA_BITS.get(criteria.strip().lower())
+        if mask:
+            query_parts.append("AND (criteria_mask & :criteria_mask) = :criteria_mask")
+            params["criteria_mask"] = mask
     
     query = text(" ".join(query_parts))
-    result = db.execute(query, params)
-    
-    features = []
-    for row in result:
-        site = dict(row)
-        feature = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [site["longitude"], site["latitude"]]
-            },
-            "properties": {
-                "id": site["id_no"],
-                "name": site["name_en"],
-                "category": site["category_short"],
-                "country": site["states_name_en"],
-                "region": site["region_en"],
-                "danger": bool(site["danger"]),
-                "transboundary": bool(site["transboundary"]),
-                "criteria": {
-                    "c1": bool(site["c1"]),
-                    "c2": bool(site["c2"]),
-                    "c3": bool(site["c3"]),
-                    "c4": bool(site["c4"]),
-                    "c5": bool(site["c5"]),
-                    "c6": bool(site["c6"]),
-                    "n7": bool(site["n7"]),
-                    "n8": bool(site["n8"]),
-                    "n9": bool(site["n9"]),
-                    "n10": bool(site["n10"])
-                }
-            }
-        }
-    
-    return features
+    return Response(await fetch_geojson(query, params), media_type="application/json")
+
+@router.post("/upload-xls/")
+async def upload_xls(file: UploadFile = File(...)):
+    """
+    Upload an Excel file to replace the heritage sites database
+    """
+    contents = await file.read()
+    async with upload_lock:
+        try:
+            # Parsing and writing are blocking, keep them off the event loop
+            staging_db, rows = await run_in_threadpool(build_import, contents)
+        except Exception as e:
+            await run_in_threadpool(discard_import)
+            raise HTTPException(status_code=400, detail=f"Could not import {file.filename}: {e}")
+        
+        try:
+            # Serve the new data first, the file is only replaced once that has worked
+            async with read_gate.refresh():
+                await run_in_threadpool(staging_db.backup, memory_db)
+                reference_cache.clear()
+            await run_in_threadpool(commit_import)
+        except Exception as e:
+            await run_in_threadpool(discard_import)
+            # The file still holds the previous data, put it back in memory
+            async with read_gate.refresh():
+                await run_in_threadpool(load_into_memory)
+                reference_cache.clear()
+            raise HTTPException(status_code=500, detail=f"Could not import {file.filename}: {e}")
+        finally:
+            staging_db.close()
+    
+    return {"filename": file.filename, "rows_imported": rows}
@@ -9,6 +9,7 @@ from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 # Local application imports
+from . import logger
 from .utils import register_routes
 
 # Miscellaneous
@@ -39,7 +40,7 @@ def setup_base_routes(app: FastAPI) -> None:
 
 def setup_addon_routers(app: FastAPI) -> None:
     """
-        Import all routes using dynamic importing (Reflections)
+        Import all routes listed in ROUTERS
     """
     register_routes(app=app)
 
@@ -0,0 +1,22 @@
+import logging
+import logging.handlers
+import atexit
+import os
+import queue
+
+LOG_FILE = os.environ.get("LOG_FILE", "/tmp/app.log")
+
+# Records are put on an in-process queue and written to the file by a background thread,
+# so logging calls never wait on disk I/O
+log_queue = queue.Queue(-1)
+
+file_handler = logging.FileHandler(LOG_FILE)
+file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
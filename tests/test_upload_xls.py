@@ -0,0 +1,83 @@
+"""
+Regression tests for /sites/upload-xls/, run from the repository root with python -m pytest
+"""
+import shutil
+import sqlite3
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from addons.unesco.routing import heritage_sites_service as service
+from main import app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """
+    Upload into a copy of the database, and put the shipped data back in memory afterwards
+    """
+    database_path = tmp_path / "sites_xlsx_export.db"
+    shutil.copy(service.DATABASE_PATH, database_path)
+    monkeypatch.setattr(service, "DATABASE_PATH", str(database_path))
+    yield TestClient(app)
+    monkeypatch.undo()
+    service.load_into_memory()
+    service.reference_cache.clear()
+
+
+def read_sites(*countries: str) -> pd.DataFrame:
+    conn = sqlite3.connect(service.DATABASE_PATH)
+    try:
+        sites = pd.read_sql("SELECT * FROM sites_xlsx_export", conn)
+    finally:
+        conn.close()
+    return sites[sites.states_name_en.isin(countries)]
+
+
+def upload(client: TestClient, sites: pd.DataFrame):
+    buffer = BytesIO()
+    sites.to_excel(buffer, index=False)
+    return client.post("/sites/upload-xls/", files={"file": ("sites.xlsx", buffer.getvalue())})
+
+
+def test_upload_keeps_column_types(client):
+    # secondary_dates only holds years for these rows, so pandas reads it as integers
+    sites = read_sites("France", "Italy")
+    response = upload(client, sites)
+    assert response.status_code == 200
+    assert response.json()["rows_imported"] == len(sites)
+
+    dated = sites[sites.secondary_dates.notna()]
+    assert len(dated)
+    for site in dated.itertuples():
+        response = client.get(f"/sites/detail/{site.id_no}")
+        assert response.status_code == 200
+        assert response.json()["secondary_dates"] == site.secondary_dates
+
+    conn = sqlite3.connect(service.DATABASE_PATH)
+    try:
+        types = {row[0] for row in conn.execute("SELECT DISTINCT typeof(secondary_dates) FROM sites_xlsx_export")}
+        columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(sites_xlsx_export)")}
+    finally:
+        conn.close()
+    assert types <= {"text", "null"}
+    assert columns["date_end"] == "REAL"
+
+
+def test_upload_drops_extra_columns(client):
+    sites = read_sites("France", "Italy").assign(criteria_mask=1023, notes="extra")
+    assert upload(client, sites).status_code == 200
+
+    response = client.get("/sites/filter", params={"criteria": "n10", "per_page": 1000})
+    assert response.status_code == 200
+    found = {site["id_no"] for site in response.json()["data"]}
+    assert found == set(sites[sites.n10 == 1].id_no)
+
+    conn = sqlite3.connect(service.DATABASE_PATH)
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sites_xlsx_export)")}
+    finally:
+        conn.close()
+    assert columns == set(service.SiteDetail.model_fields)